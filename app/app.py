@@ -2,6 +2,7 @@
 SignalScout v2 — FastAPI application serving API + dashboard.
 """
 
+import asyncio
 import json
 import threading
 from pathlib import Path
@@ -14,7 +15,7 @@ from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 import database as db
-from pipeline import run_scan, load_config
+from pipeline import run_scan, load_config, invalidate_config
 
 app = FastAPI(title="SignalScout", version="2.0")
 
@@ -28,10 +29,18 @@ _scan_running = False
 
 # --- Dashboard ---
 
+# (mtime_ns, html) of the dashboard template; re-read only when the file changes
+_dashboard_cache: tuple[int, str] | None = None
+
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard():
+    global _dashboard_cache
     html_path = TEMPLATES_DIR / "index.html"
-    return HTMLResponse(html_path.read_text())
+    mtime = html_path.stat().st_mtime_ns
+    if _dashboard_cache is None or _dashboard_cache[0] != mtime:
+        _dashboard_cache = (mtime, html_path.read_text())
+    return HTMLResponse(_dashboard_cache[1])
 
 
 # --- Leads API ---
@@ -42,22 +51,30 @@ async def list_leads(
     source: Optional[str] = None,
     min_score: Optional[float] = None,
     intent_category: Optional[str] = None,
+    q: Optional[str] = None,
     sort_by: str = "score",
     sort_order: str = "desc",
-    limit: int = Query(100, le=500),
+    limit: int = Query(100, ge=1, le=500),
     offset: int = 0,
+    cursor: Optional[str] = None,
 ):
-    leads = db.get_leads(
-        status=status, source=source, min_score=min_score,
-        intent_category=intent_category, sort_by=sort_by,
-        sort_order=sort_order, limit=limit, offset=offset
-    )
-    return {"leads": leads, "count": len(leads)}
+    try:
+        leads = await asyncio.to_thread(
+            db.get_leads,
+            status=status, source=source, min_score=min_score,
+            intent_category=intent_category, sort_by=sort_by,
+            sort_order=sort_order, limit=limit, offset=offset, cursor=cursor, q=q,
+            fields=db.LEAD_LIST_COLUMNS,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    next_cursor = db.lead_cursor(leads[-1], sort_by) if leads and len(leads) == limit else None
+    return {"leads": leads, "count": len(leads), "next_cursor": next_cursor}
 
 
 @app.get("/api/leads/{lead_id}")
 async def get_lead(lead_id: int):
-    lead = db.get_lead(lead_id)
+    lead = await asyncio.to_thread(db.get_lead, lead_id)
     if not lead:
         raise HTTPException(404, "Lead not found")
     return lead
@@ -73,11 +90,11 @@ async def update_lead(lead_id: int, update: LeadUpdate):
     updates = {k: v for k, v in update.model_dump().items() if v is not None}
     if not updates:
         raise HTTPException(400, "No updates provided")
-    lead = db.get_lead(lead_id)
+    lead = await asyncio.to_thread(db.get_lead, lead_id)
     if not lead:
         raise HTTPException(404, "Lead not found")
-    db.update_lead(lead_id, updates)
-    return db.get_lead(lead_id)
+    await asyncio.to_thread(db.update_lead, lead_id, updates)
+    return await asyncio.to_thread(db.get_lead, lead_id)
 
 
 # --- Scans API ---
@@ -106,7 +123,7 @@ async def trigger_scan():
 
 @app.get("/api/scans")
 async def list_scans():
-    return {"scans": db.get_scans()}
+    return {"scans": await asyncio.to_thread(db.get_scans)}
 
 
 @app.get("/api/scan/status")
@@ -118,7 +135,7 @@ async def scan_status():
 
 @app.get("/api/stats")
 async def get_stats():
-    return db.get_stats()
+    return await asyncio.to_thread(db.get_stats)
 
 
 # --- Config API ---
@@ -155,6 +172,7 @@ async def update_config(update: ConfigUpdate):
 
     with open(CONFIG_PATH, "w") as f:
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    invalidate_config(str(CONFIG_PATH))
     return {"status": "updated"}
 
 
@@ -2,46 +2,138 @@
 SignalScout Pipeline v2 — orchestrates source fetching, scoring, and database storage.
 """
 
+import copy
+import hashlib
 import json
 import os
 import sys
 import re
+import tempfile
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from sources import hackernews, reddit, twitter
 from scorer import score_signals
 import database as db
 
 
+CONFIG_PATH = Path(__file__).parent / "config.yaml"
+
+# Parsed configs keyed by path, validated against (mtime_ns, size) on each load
+_CFG_CACHE: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+_CFG_CACHE_SIZE = 8
+
+
+def config_sidecar_path(path: str) -> str:
+    """JSON copy of the YAML config, reused while it is newer than the YAML."""
+    return f"{path}.json"
+
+
+def invalidate_config(path: str = None):
+    """Drop the cached and sidecar copies after rewriting the YAML; (mtime, size) alone
+    can miss a same-size edit within a coarse mtime tick."""
+    if path is None:
+        path = str(CONFIG_PATH)
+    _CFG_CACHE.pop(path, None)
+    Path(config_sidecar_path(path)).unlink(missing_ok=True)
+
+
 def load_config(path: str = None) -> dict:
     if path is None:
-        path = str(Path(__file__).parent / "config.yaml")
+        path = str(CONFIG_PATH)
+    st = os.stat(path)
+    cached = _CFG_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _CFG_CACHE.move_to_end(path)
+        # Callers mutate the returned dict (e.g. masking the API key), so hand out a copy
+        return copy.deepcopy(cached[2])
+
+    config = _read_config(path, st)
+    _CFG_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+    _CFG_CACHE.move_to_end(path)
+    while len(_CFG_CACHE) > _CFG_CACHE_SIZE:
+        _CFG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+def _read_config(path: str, st: os.stat_result) -> dict:
+    sidecar = config_sidecar_path(path)
+    try:
+        if os.stat(sidecar).st_mtime_ns >= st.st_mtime_ns:
+            with open(sidecar) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
     with open(path) as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
+    # Written to a temp file and renamed in, so a failed dump never leaves a truncated
+    # sidecar behind; it keeps the YAML's permission bits since it may hold the API key
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(sidecar) or ".", suffix=".tmp")
+    except OSError:
+        return config
+    try:
+        with os.fdopen(fd, "w") as f:
+            os.fchmod(f.fileno(), st.st_mode & 0o777)
+            json.dump(config, f)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return config
 
 
 def deduplicate(signals: list[dict]) -> list[dict]:
-    seen = {}
-    deduped = []
-    for s in signals:
-        key = _normalize(s.get("title", ""))
-        if key and key in seen:
-            if s.get("score", 0) > seen[key].get("score", 0):
-                deduped = [x for x in deduped if x.get("id") != seen[key].get("id")]
-                deduped.append(s)
-                seen[key] = s
-        else:
-            if key:
-                seen[key] = s
-            deduped.append(s)
-    return deduped
+    """Keep the highest-scoring signal per normalized title, in first-seen order."""
+    # Sorting puts each title's best signal (then earliest, on ties) at the head of its run
+    keyed = sorted(
+        (_fingerprint(s.get("title", "")), -(s.get("score") or 0), i)
+        for i, s in enumerate(signals)
+    )
+    keep = []
+    prev = None
+    for fp, _, i in keyed:
+        # Untitled signals (fingerprint 0) are never duplicates
+        if fp != prev or not fp:
+            keep.append(i)
+            prev = fp
+    keep.sort()
+    return [signals[i] for i in keep]
+
+
+_NORM_RE = re.compile(r'[^a-z0-9 ]')
 
 
 def _normalize(text: str) -> str:
-    return re.sub(r'[^a-z0-9 ]', '', text.lower()).strip()
+    return _NORM_RE.sub('', unicodedata.normalize("NFKC", text).casefold()).strip()
+
+
+def _fingerprint(text: str) -> int:
+    """128-bit hash of the normalized title (0 if empty), used as a compact dedup key."""
+    norm = _normalize(text)
+    if not norm:
+        return 0
+    if xxhash is not None:
+        return xxhash.xxh3_128_intdigest(norm.encode())
+    return int.from_bytes(hashlib.blake2b(norm.encode(), digest_size=16).digest(), "big")
 
 
 def run_scan(config: dict = None) -> dict:
@@ -62,19 +154,12 @@ def run_scan(config: dict = None) -> dict:
     print(f"\n🔍 Scan #{scan_id} started — sources: {', '.join(sources_used)}")
 
     try:
-        all_signals = []
-
-        if "hackernews" in sources_used:
-            print("  → Fetching Hacker News...")
-            all_signals.extend(hackernews.fetch_signals(config))
-
-        if "reddit" in sources_used:
-            print("  → Fetching Reddit...")
-            all_signals.extend(reddit.fetch_signals(config))
-
-        if "twitter" in sources_used:
-            print("  → Fetching Twitter...")
-            all_signals.extend(twitter.fetch_signals(config))
+        fetchers = {"hackernews": hackernews, "reddit": reddit, "twitter": twitter}
+        print(f"  → Fetching {', '.join(sources_used)}...")
+        # Sources hit different hosts, so fetch them concurrently; each paces its own requests
+        with ThreadPoolExecutor(max_workers=max(len(sources_used), 1)) as pool:
+            results = list(pool.map(lambda name: fetchers[name].fetch_signals(config), sources_used))
+        all_signals = [signal for signals in results for signal in signals]
 
         print(f"  📥 Total raw signals: {len(all_signals)}")
 
@@ -97,25 +182,23 @@ def run_scan(config: dict = None) -> dict:
 
         # Store in DB
         leads_stored = 0
-        for signal in final:
-            try:
-                db.upsert_lead({
-                    "source": signal.get("source", ""),
-                    "title": signal.get("title", ""),
-                    "url": signal.get("url", ""),
-                    "author": signal.get("author", ""),
-                    "text": signal.get("content", ""),
-                    "score": signal.get("score"),
-                    "ai_score": signal.get("ai_score"),
-                    "ai_reasoning": signal.get("ai_reasoning"),
-                    "intent_category": signal.get("intent_category"),
-                    "suggested_response": signal.get("suggested_response"),
-                    "engagement_upvotes": signal.get("points", 0),
-                    "engagement_comments": signal.get("num_comments", 0),
-                })
-                leads_stored += 1
-            except Exception as e:
-                print(f"  ⚠️ Failed to store lead: {e}")
+        try:
+            leads_stored = db.upsert_leads([{
+                "source": signal.get("source", ""),
+                "title": signal.get("title", ""),
+                "url": signal.get("url", ""),
+                "author": signal.get("author", ""),
+                "text": signal.get("content", ""),
+                "score": signal.get("score"),
+                "ai_score": signal.get("ai_score"),
+                "ai_reasoning": signal.get("ai_reasoning"),
+                "intent_category": signal.get("intent_category"),
+                "suggested_response": signal.get("suggested_response"),
+                "engagement_upvotes": signal.get("points", 0),
+                "engagement_comments": signal.get("num_comments", 0),
+            } for signal in final])
+        except Exception as e:
+            print(f"  ⚠️ Failed to store leads: {e}")
 
         db.complete_scan(scan_id, len(all_signals), leads_stored, "completed")
         print(f"  ✅ Scan #{scan_id} complete — {leads_stored} leads stored")
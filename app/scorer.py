@@ -2,61 +2,226 @@
 Signal scorer — heuristic + AI-powered scoring via Claude.
 """
 
-import json
+import functools
+import hashlib
+import heapq
+import math
+import multiprocessing
+import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
+from operator import itemgetter
+from pathlib import Path
+
+import orjson
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this many signals, process start-up costs more than scoring in-process
+PARALLEL_MIN_SIGNALS = 20000
+
+AI_MODEL = "claude-sonnet-4-20250514"
+BATCH_POLL_INTERVAL = 10
+# How long a timed-out batch gets to wind down after cancelling
+BATCH_CANCEL_GRACE = 300
+AI_CACHE_PATH = Path(__file__).parent / ".ai_cache"
+AI_CACHE_TTL = 30 * 86400
+
+
+def score_signals_heuristic(signals: list[dict], config: dict, top_k: int | None = None) -> list[dict]:
+    """Score each signal using heuristic rules. Returns sorted list, cut to the
+    top_k highest scores when given."""
+    workers = os.cpu_count() or 1
+    if len(signals) >= PARALLEL_MIN_SIGNALS and workers > 1:
+        size = -(-len(signals) // workers)
+        chunks = [signals[i:i + size] for i in range(0, len(signals), size)]
+        # spawn, not fork: the API server calls this from a worker thread
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            scored = [s for part in pool.map(_score_heuristic_chunk, chunks, repeat(config)) for s in part]
+    else:
+        scored = _score_heuristic_chunk(signals, config)
+
+    print(f"  [Scorer] Heuristic scored {len(scored)} signals")
+    if top_k is not None and top_k < len(scored):
+        return heapq.nlargest(top_k, scored, key=itemgetter("score"))
+    scored.sort(key=itemgetter("score"), reverse=True)
+    return scored
 
 
-def score_signals_heuristic(signals: list[dict], config: dict) -> list[dict]:
-    """Score each signal using heuristic rules. Returns sorted list."""
-    keywords = [k.lower() for k in config["icp"]["keywords"]]
-    pain_points = [p.lower() for p in config["icp"].get("pain_points", [])]
-    negative_keywords = [n.lower() for n in config.get("negative_keywords", [])]
+def _score_heuristic_chunk(signals: list[dict], config: dict) -> list[dict]:
+    keywords = tuple(k.lower() for k in config["icp"]["keywords"])
+    pain_points = tuple(p.lower() for p in config["icp"].get("pain_points", []))
+    negative_keywords = tuple(n.lower() for n in config.get("negative_keywords", []))
     weights = config["scoring"]["weights"]
 
-    scored = []
+    match = _build_matcher(keywords, pain_points, negative_keywords)
+
+    # Loop invariants, resolved once per run rather than per signal
+    w_kw = weights.get("keyword_match", 0.4)
+    w_pp = weights.get("pain_point_match", 0.2)
+    w_rec = weights.get("recency", 0.2)
+    w_eng = weights.get("engagement", 0.2)
+    kw_scale = 10.0 / max(len(keywords) * 0.3, 1)
+    pp_scale = 10.0 / max(len(pain_points) * 0.2, 1)
+    rec_max = 10 * w_rec
+    now_ts = time.time()
+
+    # Signals below this are dropped by the pipeline's min_score filter (and never
+    # reach AI scoring), so ones that cannot reach it skip the exact score
+    scoring_config = config["scoring"]
+    cutoff = min(scoring_config.get("min_score", 3), scoring_config.get("ai_threshold", 4))
+
+    # Text pass: match once per signal and keep one row per survivor
+    rows = []
+    append = rows.append
     for signal in signals:
-        content = signal.get("content", "").lower()
-        title = signal.get("title", "").lower()
-        text = f"{title} {content}"
-
-        # Check negative keywords — skip if matched
-        if any(nk in text for nk in negative_keywords):
+        get = signal.get
+        content = get("content", "").lower()
+        title = get("title", "").lower()
+
+        # None means a negative keyword matched — skip. Every source leads its content
+        # with the title, so that usually takes a single scan; the prefix must end on a
+        # word boundary, or a phrase ending the title ("foo" in "foobar") would be missed
+        n = len(title)
+        if content.startswith(title) and (n == len(content) or not _is_word_char(content[n])):
+            hits = match(content)
+        else:
+            hits = match(title, content)
+        if hits is None:
             continue
+        points, comments = get("points", 0), get("num_comments", 0)
+
+        # Even a perfect recency score rounds below the cutoff: skip the timestamp parse (unknown
+        # age) and the breakdown
+        bound = (min(10, hits[0] * kw_scale) * w_kw + min(10, hits[1] * pp_scale) * w_pp
+                 + min(10, (points + comments * 2) * 0.2) * w_eng + rec_max)
+        if round(max(1, bound), 1) < cutoff:
+            append((signal, hits[0], hits[1], math.nan, points, comments, False))
+            continue
+        age = (now_ts - _created_ts(get("created_at", ""))) / 3600
+        append((signal, hits[0], hits[1], age, points, comments, True))
+
+    if not rows:
+        return []
+    # Transpose to columns for the numeric pass: compiled with numba, else vectorized with numpy
+    kept, kw_hits, pp_hits, ages, points, comments, exact = zip(*rows)
+    n = len(kept)
+    if np is not None:
+        columns = [np.array(c, dtype=np.float64) for c in (kw_hits, pp_hits, ages, points, comments)]
+        if njit is not None:
+            out = _score_rows_jit(*columns, w_kw, w_pp, w_rec, w_eng, kw_scale, pp_scale, np.empty((n, 5)))
+        else:
+            out = _score_rows_numpy(*columns, w_kw, w_pp, w_rec, w_eng, kw_scale, pp_scale)
+        results = out.tolist()
+    else:
+        results = _score_rows(
+            kw_hits, pp_hits, ages, points, comments, w_kw, w_pp, w_rec, w_eng, kw_scale, pp_scale,
+            [[0.0] * 5 for _ in range(n)],
+        )
 
-        kw_hits = sum(1 for kw in keywords if kw in text)
-        kw_score = min(10, (kw_hits / max(len(keywords) * 0.3, 1)) * 10)
+    scored = []
+    for signal, is_exact, (total, kw_score, pp_score, recency_score, eng_score) in zip(kept, exact, results):
+        signal["score"] = round(total, 1)
+        if is_exact:
+            signal["score_breakdown"] = {
+                "keyword": round(kw_score, 1),
+                "pain_point": round(pp_score, 1),
+                "recency": round(recency_score, 1),
+                "engagement": round(eng_score, 1),
+            }
+        scored.append(signal)
 
-        pp_hits = sum(1 for pp in pain_points if pp in text)
-        pp_score = min(10, (pp_hits / max(len(pain_points) * 0.2, 1)) * 10)
+    return scored
 
-        recency_score = _recency_score(signal.get("created_at", ""))
 
-        points = signal.get("points", 0)
-        comments = signal.get("num_comments", 0)
-        engagement = points + comments * 2
-        eng_score = min(10, (engagement / 50) * 10)
+_KEYWORD, _PAIN_POINT, _NEGATIVE = 0, 1, 2
+
+
+@functools.lru_cache(maxsize=8)
+def _build_matcher(keywords: tuple, pain_points: tuple, negative_keywords: tuple):
+    """Return match(*texts) -> (keyword hits, pain point hits), or None if any negative
+    keyword occurs. Phrases only match on word boundaries ("ai" does not hit
+    "maintain") and hits count distinct phrases. Uses a single Aho-Corasick pass per
+    text when pyahocorasick is installed, otherwise a C substring test per phrase with a
+    precompiled boundary regex run only on the phrases that are present."""
+    phrases = {}
+    for kind, words in ((_KEYWORD, keywords), (_PAIN_POINT, pain_points), (_NEGATIVE, negative_keywords)):
+        for word in words:
+            if word:
+                phrases.setdefault(word, set()).add(kind)
+
+    if ahocorasick is None or not phrases:
+        kw_res, pp_res, neg_res = _phrase_patterns(keywords), _phrase_patterns(pain_points), _phrase_patterns(negative_keywords)
+
+        def match(*texts: str):
+            if len(texts) == 1:
+                text = texts[0]
+                if any(w in text and r.search(text) for w, r in neg_res):
+                    return None
+                return (
+                    sum(1 for w, r in kw_res if w in text and r.search(text)),
+                    sum(1 for w, r in pp_res if w in text and r.search(text)),
+                )
+            if any(w in t and r.search(t) for w, r in neg_res for t in texts):
+                return None
+            return (
+                sum(1 for w, r in kw_res if any(w in t and r.search(t) for t in texts)),
+                sum(1 for w, r in pp_res if any(w in t and r.search(t) for t in texts)),
+            )
+        return match
 
-        total = (
-            kw_score * weights.get("keyword_match", 0.4) +
-            pp_score * weights.get("pain_point_match", 0.2) +
-            recency_score * weights.get("recency", 0.2) +
-            eng_score * weights.get("engagement", 0.2)
-        )
-        final_score = round(min(10, max(1, total)), 1)
-
-        signal["score"] = final_score
-        signal["score_breakdown"] = {
-            "keyword": round(kw_score, 1),
-            "pain_point": round(pp_score, 1),
-            "recency": round(recency_score, 1),
-            "engagement": round(eng_score, 1),
-        }
-        scored.append(signal)
+    automaton = ahocorasick.Automaton()
+    for word, kinds in phrases.items():
+        automaton.add_word(word, (word, frozenset(kinds)))
+    automaton.make_automaton()
 
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    print(f"  [Scorer] Heuristic scored {len(scored)} signals")
-    return scored
+    def match(*texts: str):
+        kw, pp = set(), set()
+        for text in texts:
+            last = len(text) - 1
+            for end, (word, kinds) in automaton.iter(text):
+                start = end - len(word) + 1
+                if (start > 0 and _is_word_char(text[start - 1])) or (end < last and _is_word_char(text[end + 1])):
+                    continue
+                if _NEGATIVE in kinds:
+                    return None
+                if _KEYWORD in kinds:
+                    kw.add(word)
+                if _PAIN_POINT in kinds:
+                    pp.add(word)
+        return len(kw), len(pp)
+    return match
+
+
+def _phrase_patterns(words: tuple) -> tuple:
+    return tuple((w, re.compile(r"(?<!\w)" + re.escape(w) + r"(?!\w)")) for w in dict.fromkeys(words) if w)
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
 
 
 def score_signals_ai(signals: list[dict], config: dict) -> list[dict]:
@@ -75,67 +240,287 @@ def score_signals_ai(signals: list[dict], config: dict) -> list[dict]:
         print(f"  [Scorer] Failed to init Anthropic client: {e}")
         return signals
 
-    icp_desc = json.dumps({
+    icp_desc = orjson.dumps({
         "description": config["icp"]["description"],
         "keywords": config["icp"]["keywords"],
         "pain_points": config["icp"].get("pain_points", []),
         "industries": config["icp"].get("industries", []),
-    })
+    }).decode()
 
     max_ai = scoring_config.get("max_ai_per_run", 50)
     ai_threshold = scoring_config.get("ai_threshold", 4)
+    group_size = max(1, scoring_config.get("ai_batch_size", 20))
+
+    todo = [
+        s for s in signals
+        if s.get("score", 0) >= ai_threshold
+        and (s.get("title") or s.get("content") or s.get("text"))
+    ][:max_ai]
+
+    # Re-runs see the same posts again; reuse their results instead of re-asking Claude
     ai_count = 0
+    cache = _open_ai_cache() if scoring_config.get("ai_cache", True) else None
+    if cache is not None:
+        icp_hash = hashlib.blake2b(icp_desc.encode(), digest_size=16).hexdigest()
+        keys = {id(s): _ai_cache_key(icp_hash, s) for s in todo}
+        pending = []
+        for signal in todo:
+            result = cache.get(keys[id(signal)])
+            if result is None:
+                pending.append(signal)
+            else:
+                _apply_ai_result(signal, result)
+                ai_count += 1
+        if ai_count:
+            print(f"  [Scorer] Reused cached AI results for {ai_count} signals")
+        todo = pending
+
+    # Several posts per prompt, so the ICP preamble is paid once per group
+    groups = [todo[i:i + group_size] for i in range(0, len(todo), group_size)]
+    requests = [_message_params(icp_desc, group) for group in groups]
+
+    concurrency = scoring_config.get("ai_concurrency", 8)
+    if not requests:
+        replies = []
+    elif scoring_config.get("ai_transport", "batch") == "sync":
+        replies = _send_sync(client, requests, concurrency)
+    else:
+        # Only a batch that was never created falls back; once submitted it is billed,
+        # so later errors keep whatever it returned rather than sending it all again
+        try:
+            batch = _create_message_batch(client, requests)
+        except Exception as e:
+            print(f"  [Scorer] Message batch failed, retrying synchronously: {e}")
+            replies = _send_sync(client, requests, concurrency)
+        else:
+            replies = _collect_message_batch(client, batch, len(requests), scoring_config.get("ai_batch_timeout", 900))
 
-    for signal in signals:
-        if ai_count >= max_ai:
-            break
-        if signal.get("score", 0) < ai_threshold:
+    for group, reply in zip(groups, replies):
+        if reply is None:
             continue
-
-        title = signal.get("title", "")
-        text = signal.get("content", "") or signal.get("text", "")
-        if not title and not text:
+        try:
+            results = _parse_batch_results(reply, len(group))
+        except ValueError as e:
+            print(f"  [Scorer] Unparseable AI reply for {len(group)} posts: {e}")
             continue
 
+        for signal, result in zip(group, results):
+            if result is None:
+                continue
+            _apply_ai_result(signal, result)
+            if cache is not None:
+                cache.set(keys[id(signal)], result, expire=AI_CACHE_TTL)
+            ai_count += 1
+
+    if cache is not None:
+        cache.close()
+    print(f"  [Scorer] AI scored {ai_count} signals")
+    return signals
+
+
+def _apply_ai_result(signal: dict, result: dict):
+    signal["ai_score"] = result.get("score", signal.get("score"))
+    signal["intent_category"] = result.get("category", "noise")
+    signal["ai_reasoning"] = result.get("reasoning", "")
+    signal["suggested_response"] = result.get("suggested_response", "")
+
+
+def _open_ai_cache():
+    if diskcache is None:
+        return None
+    try:
+        return diskcache.Cache(str(AI_CACHE_PATH))
+    except Exception as e:
+        print(f"  [Scorer] AI result cache unavailable: {e}")
+        return None
+
+
+def _ai_cache_key(icp_hash: str, signal: dict) -> str:
+    """Covers everything the prompt sees about the post, plus the model and ICP."""
+    title = signal.get("title", "")
+    text = signal.get("content", "") or signal.get("text", "")
+    raw = f"{AI_MODEL}|{icp_hash}|{signal.get('id', '')}|{title}|{text[:1000]}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _send_sync(client, requests: list[dict], concurrency: int = 8) -> list[str | None]:
+    """messages.create per request, run concurrently on the shared client (whose
+    connection pool is thread-safe); lowest latency, full price."""
+    errors = []
+
+    def call(params: dict) -> str | None:
         try:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=300,
-                messages=[{
-                    "role": "user",
-                    "content": f"""You are a B2B sales intelligence analyst. Given this social media post and the target ICP described below, rate the buying intent from 1-10 and classify as high_intent/medium_intent/low_intent/noise. Also suggest a brief, natural response the user could post to engage this prospect. Return JSON only.
+            return client.messages.create(**params).content[0].text
+        except Exception as e:
+            errors.append(e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        replies = list(pool.map(call, requests))
+    if errors:
+        print(f"  [Scorer] {len(errors)} of {len(requests)} AI requests failed: {errors[-1]}")
+    return replies
+
+
+def _create_message_batch(client, requests: list[dict]):
+    """Submit all requests as one Message Batch (half price, provider-scheduled)."""
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": f"req-{i}", "params": params} for i, params in enumerate(requests)
+    ])
+    print(f"  [Scorer] Submitted message batch {batch.id} ({len(requests)} requests)")
+    return batch
+
+
+def _collect_message_batch(client, batch, n: int, timeout: float) -> list[str | None]:
+    """Wait for a submitted batch and return its replies (None where missing). After
+    `timeout` seconds the batch is cancelled, but requests that already finished are
+    still read back; polling and result errors keep what has been collected."""
+    deadline = time.monotonic() + timeout
+    cancelled = False
+    while batch.processing_status != "ended":
+        now = time.monotonic()
+        if now >= deadline + BATCH_CANCEL_GRACE:
+            print(f"  [Scorer] Message batch {batch.id} did not end, giving up on its results")
+            return [None] * n
+        if not cancelled and now >= deadline:
+            print(f"  [Scorer] Message batch {batch.id} timed out, cancelling unfinished requests")
+            cancelled = True
+            try:
+                client.messages.batches.cancel(batch.id)
+            except Exception as e:
+                print(f"  [Scorer] Cancelling message batch {batch.id} failed: {e}")
+        time.sleep(BATCH_POLL_INTERVAL)
+        try:
+            batch = client.messages.batches.retrieve(batch.id)
+        except Exception as e:
+            print(f"  [Scorer] Polling message batch {batch.id} failed: {e}")
+
+    replies = [None] * n
+    failed = Counter()
+    try:
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                replies[int(entry.custom_id.split("-", 1)[1])] = entry.result.message.content[0].text
+            else:
+                failed[entry.result.type] += 1
+    except Exception as e:
+        print(f"  [Scorer] Reading message batch {batch.id} results failed: {e}")
+    if failed:
+        print(f"  [Scorer] Message batch {batch.id}: " + ", ".join(f"{n} {kind}" for kind, n in failed.items()))
+    return replies
+
+
+def _message_params(icp_desc: str, group: list[dict]) -> dict:
+    return {
+        "model": AI_MODEL,
+        "max_tokens": 300 * len(group),
+        "messages": [{"role": "user", "content": _batch_prompt(icp_desc, group)}],
+    }
+
+
+def _batch_prompt(icp_desc: str, batch: list[dict]) -> str:
+    posts = []
+    for n, signal in enumerate(batch, 1):
+        title = signal.get("title", "")
+        text = signal.get("content", "") or signal.get("text", "")
+        posts.append(f"Post {n}\nPost Title: {title}\nPost Content: {text[:1000]}")
+    posts = "\n\n".join(posts)
+    return f"""You are a B2B sales intelligence analyst. Given the social media posts below and the target ICP described below, rate each post's buying intent from 1-10 and classify it as high_intent/medium_intent/low_intent/noise. Also suggest a brief, natural response the user could post to engage each prospect. Return JSON only.
 
 ICP: {icp_desc}
 
-Post Title: {title}
-Post Content: {text[:1000]}
+{posts}
 
-Return ONLY valid JSON with keys: score (int 1-10), category (string), reasoning (string, 1-2 sentences), suggested_response (string)"""
-                }]
-            )
-            result_text = response.content[0].text.strip()
-            # Extract JSON from response
-            json_match = re.search(r'\{[^{}]+\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-                signal["ai_score"] = result.get("score", signal.get("score"))
-                signal["intent_category"] = result.get("category", "noise")
-                signal["ai_reasoning"] = result.get("reasoning", "")
-                signal["suggested_response"] = result.get("suggested_response", "")
-                ai_count += 1
-        except Exception as e:
-            print(f"  [Scorer] AI scoring failed for '{title[:40]}': {e}")
-            continue
+Return ONLY a valid JSON array with one object per post, each with keys: post (int, the post number), score (int 1-10), category (string), reasoning (string, 1-2 sentences), suggested_response (string)"""
 
-    print(f"  [Scorer] AI scored {ai_count} signals")
-    return signals
+
+def _parse_batch_results(result_text: str, n: int) -> list[dict | None]:
+    """Map a JSON array reply back onto the n posts of a batch (None where missing)."""
+    items = _extract_json(result_text)
+    if isinstance(items, dict):
+        items = [items]
+
+    items = [item for item in items if isinstance(item, dict)]
+    results = [None] * n
+    # Reply order stands in for post numbers only when the reply gives none at all
+    if not any("post" in item for item in items):
+        for item, pos in zip(items, range(n)):
+            results[pos] = item
+        return results
+
+    for item in items:
+        try:
+            idx = int(item["post"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 1 <= idx <= n:
+            results[idx - 1] = item
+    return results
+
+
+def _extract_json(text: str):
+    """Parse the first balanced JSON array or object in a reply. Bracketed prose such
+    as "[1-3]" or an unclosed "[" is skipped, and brackets inside strings don't count.
+    Raises ValueError if there is none."""
+    pos = 0
+    while True:
+        starts = [i for i in (text.find("[", pos), text.find("{", pos)) if i != -1]
+        if not starts:
+            raise ValueError("no JSON in reply")
+        start = min(starts)
+        end = _closing_bracket(text, start)
+        if end == -1:
+            pos = start + 1
+            continue
+        try:
+            return orjson.loads(text[start:end + 1])
+        except orjson.JSONDecodeError:
+            pos = end + 1
+
+
+def _closing_bracket(text: str, start: int) -> int:
+    """Index of the bracket closing the one at text[start], or -1 if never closed."""
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "[{":
+            depth += 1
+        elif c in "]}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
 
 
 def score_signals(signals: list[dict], config: dict) -> list[dict]:
     """Main scoring entry point — applies heuristic, then optionally AI."""
-    scored = score_signals_heuristic(signals, config)
+    # Overlapping queries return the same post more than once; score (and pay for) it once
+    seen = set()
+    unique = []
+    for s in signals:
+        key = s.get("id") or (s.get("source"), s.get("content", ""))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(s)
 
-    mode = config.get("scoring", {}).get("mode", "heuristic")
+    # Only the head of the ranking is AI-scored or stored, so don't sort the tail
+    scoring_config = config.get("scoring", {})
+    max_leads = config.get("output", {}).get("max_leads", 50)
+    top_k = scoring_config.get("top_k", max(100, scoring_config.get("max_ai_per_run", 50) * 2, max_leads * 2))
+    scored = score_signals_heuristic(unique, config, top_k)
+
+    mode = scoring_config.get("mode", "heuristic")
     if mode in ("ai", "hybrid"):
         scored = score_signals_ai(scored, config)
         # Re-sort by AI score if available, else heuristic
@@ -157,27 +542,66 @@ def score_signals(signals: list[dict], config: dict) -> list[dict]:
     return scored
 
 
-def _recency_score(created_at: str) -> float:
+_RECENCY_BUCKETS = ((6.0, 10.0), (24.0, 8.0), (72.0, 6.0), (168.0, 4.0))
+
+
+def _created_ts(created_at) -> float:
+    """Unix timestamp for an ISO string or numeric `created_at`; NaN when unknown."""
     if not created_at:
-        return 5.0
+        return math.nan
     try:
-        if isinstance(created_at, str):
-            created_at = created_at.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(created_at)
-        else:
-            dt = datetime.fromtimestamp(created_at, tz=timezone.utc)
+        if isinstance(created_at, (int, float)):
+            return float(created_at)
+        dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        age_hours = (datetime.now(timezone.utc) - dt).total_seconds() / 3600
-        if age_hours < 6:
-            return 10.0
-        elif age_hours < 24:
-            return 8.0
-        elif age_hours < 72:
-            return 6.0
-        elif age_hours < 168:
-            return 4.0
-        else:
-            return 2.0
+        return dt.timestamp()
     except Exception:
-        return 5.0
+        return math.nan
+
+
+def _score_rows(kw_hits, pp_hits, ages, points, comments, w_kw, w_pp, w_rec, w_eng, kw_scale, pp_scale, out):
+    """Fill out[i] with (total, keyword, pain point, recency, engagement) scores.
+    Indexed loop over plain columns so numba can compile it; ages are in hours, NaN
+    when the post time is unknown."""
+    for i in range(len(kw_hits)):
+        kw_score = min(10.0, kw_hits[i] * kw_scale)
+        pp_score = min(10.0, pp_hits[i] * pp_scale)
+        eng_score = min(10.0, (points[i] + comments[i] * 2) * 0.2)
+
+        age = ages[i]
+        if math.isnan(age):
+            recency_score = 5.0
+        else:
+            recency_score = 2.0
+            for limit, score in _RECENCY_BUCKETS:
+                if age < limit:
+                    recency_score = score
+                    break
+
+        total = kw_score * w_kw + pp_score * w_pp + recency_score * w_rec + eng_score * w_eng
+        row = out[i]
+        row[0] = min(10.0, max(1.0, total))
+        row[1] = kw_score
+        row[2] = pp_score
+        row[3] = recency_score
+        row[4] = eng_score
+    return out
+
+
+_score_rows_jit = njit(cache=True)(_score_rows) if njit is not None else None
+
+
+def _score_rows_numpy(kw_hits, pp_hits, ages, points, comments, w_kw, w_pp, w_rec, w_eng, kw_scale, pp_scale):
+    """Whole-array equivalent of _score_rows for when numba is not installed."""
+    kw_score = np.minimum(10.0, kw_hits * kw_scale)
+    pp_score = np.minimum(10.0, pp_hits * pp_scale)
+    eng_score = np.minimum(10.0, (points + comments * 2) * 0.2)
+    # NaN compares false everywhere, so unknown ages need their own branch
+    recency_score = np.select(
+        [np.isnan(ages)] + [ages < limit for limit, _ in _RECENCY_BUCKETS],
+        [5.0] + [score for _, score in _RECENCY_BUCKETS],
+        default=2.0,
+    )
+    total = kw_score * w_kw + pp_score * w_pp + recency_score * w_rec + eng_score * w_eng
+    return np.column_stack((np.clip(total, 1.0, 10.0), kw_score, pp_score, recency_score, eng_score))
@@ -4,12 +4,34 @@ Uses public JSON endpoints — no API key required.
 Appends .json to Reddit URLs for public access.
 """
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 REDDIT_BASE = "https://www.reddit.com"
 HEADERS = {"User-Agent": "SignalScout/1.0 (B2B Lead Detection Tool)"}
 
+# Be polite to Reddit: at most one request per REQUEST_INTERVAL seconds across all
+# workers; the workers only overlap waiting on responses.
+REQUEST_INTERVAL = 1.0
+ERROR_BACKOFF = 2.0
+MAX_CONCURRENT_REQUESTS = 2
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+# Pooled session; its retries absorb the occasional 429 from Reddit
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
 
 def fetch_signals(config: dict) -> list[dict]:
     """Fetch Reddit posts matching ICP from configured subreddits."""
@@ -21,58 +43,77 @@ def fetch_signals(config: dict) -> list[dict]:
     search_queries = reddit_config.get("search_queries", config["icp"]["keywords"][:3])
     max_posts = reddit_config.get("max_posts_per_sub", 25)
 
+    jobs = [(sub, query) for sub in subreddits for query in search_queries]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        results = list(pool.map(lambda job: _search(*job, max_posts), jobs))
+
     signals = []
     seen_ids = set()
+    append = signals.append
 
-    for sub in subreddits:
-        for query in search_queries:
-            try:
-                url = f"{REDDIT_BASE}/r/{sub}/search.json"
-                resp = requests.get(url, params={
-                    "q": query,
-                    "restrict_sr": "on",
-                    "sort": "new",
-                    "t": "week",
-                    "limit": min(max_posts, 25),
-                }, headers=HEADERS, timeout=15)
-                resp.raise_for_status()
-                posts = resp.json().get("data", {}).get("children", [])
-            except Exception as e:
-                print(f"  [Reddit] Error on r/{sub} '{query}': {e}")
-                time.sleep(2)
+    for (sub, _query), posts in zip(jobs, results):
+        for post in posts:
+            get = post.get("data", {}).get
+            post_id = get("id", "")
+            if post_id in seen_ids:
                 continue
+            seen_ids.add(post_id)
+
+            title = get("title", "")
 
-            for post in posts:
-                data = post.get("data", {})
-                post_id = data.get("id", "")
-                if post_id in seen_ids:
-                    continue
-                seen_ids.add(post_id)
-
-                title = data.get("title", "")
-                selftext = data.get("selftext", "")
-                content = f"{title} {selftext}".strip()
-
-                signals.append({
-                    "source": "reddit",
-                    "id": f"reddit-{post_id}",
-                    "title": title,
-                    "content": content,
-                    "url": f"https://reddit.com{data.get('permalink', '')}",
-                    "subreddit": data.get("subreddit", sub),
-                    "author": data.get("author", ""),
-                    "created_at": _ts_to_iso(data.get("created_utc", 0)),
-                    "points": data.get("score", 0),
-                    "num_comments": data.get("num_comments", 0),
-                })
-
-            # Be polite to Reddit
-            time.sleep(1)
+            append({
+                "source": "reddit",
+                "id": f"reddit-{post_id}",
+                "title": title,
+                "content": f"{title} {get('selftext', '')}".strip(),
+                "url": f"https://reddit.com{get('permalink', '')}",
+                "subreddit": get("subreddit", sub),
+                "author": get("author", ""),
+                "created_at": _ts_to_iso(get("created_utc", 0)),
+                "points": get("score", 0),
+                "num_comments": get("num_comments", 0),
+            })
 
     print(f"  [Reddit] Fetched {len(signals)} signals")
     return signals
 
 
+def _search(sub: str, query: str, max_posts: int) -> list[dict]:
+    _wait_turn()
+    try:
+        url = f"{REDDIT_BASE}/r/{sub}/search.json"
+        resp = _SESSION.get(url, params={
+            "q": query,
+            "restrict_sr": "on",
+            "sort": "new",
+            "t": "week",
+            "limit": min(max_posts, 25),
+        }, timeout=15)
+        resp.raise_for_status()
+        return orjson.loads(resp.content).get("data", {}).get("children", [])
+    except Exception as e:
+        print(f"  [Reddit] Error on r/{sub} '{query}': {e}")
+        _backoff(ERROR_BACKOFF)
+        return []
+
+
+def _wait_turn():
+    """Sleep until this thread's request slot, keeping requests REQUEST_INTERVAL apart."""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + REQUEST_INTERVAL
+    time.sleep(start - now)
+
+
+def _backoff(seconds: float):
+    """Hold off all further requests for at least `seconds`."""
+    global _next_request_at
+    with _rate_lock:
+        _next_request_at = max(_next_request_at, time.monotonic() + seconds)
+
+
 def _ts_to_iso(ts):
     if not ts:
         return ""
@@ -2,25 +2,54 @@
 SignalScout Database — SQLite schema + CRUD operations.
 """
 
+import base64
+import copy
 import sqlite3
 import json
 import os
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "signalscout.db"
 
+# SQL expression (format with a column or parameter) giving the dedup key for a title
+_NORM_TITLE_SQL = "lower(trim({}))"
+
+_fts_enabled = False
+
+# get_stats() result, reused until a lead write bumps _leads_version, the day rolls
+# over (new_today), or STATS_CACHE_TTL passes (writes from other processes)
+STATS_CACHE_TTL = 60
+_leads_version = 0
+_stats_cache: tuple[tuple, float, dict] | None = None
+
+
+_local = threading.local()
+
 
 def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
+    """Return this thread's long-lived connection, opening it on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(str(DB_PATH))
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        # Under WAL, NORMAL only syncs at checkpoints and is still crash-safe
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Wait on the scan thread's write lock instead of raising SQLITE_BUSY
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        _local.conn = conn
     return conn
 
 
 def init_db():
     conn = get_connection()
+    # journal_mode is persisted in the database file, so it only needs setting once
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS leads (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,7 +69,8 @@ def init_db():
             notes TEXT,
             discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             contacted_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            norm_title TEXT
         );
 
         CREATE TABLE IF NOT EXISTS scans (
@@ -58,57 +88,187 @@ def init_db():
             value TEXT
         );
 
-        CREATE INDEX IF NOT EXISTS idx_leads_status ON leads(status);
-        CREATE INDEX IF NOT EXISTS idx_leads_source ON leads(source);
-        CREATE INDEX IF NOT EXISTS idx_leads_score ON leads(score DESC);
-        CREATE INDEX IF NOT EXISTS idx_leads_intent ON leads(intent_category);
+        -- Dashboard filters on one of these and sorts by score; the composites cover
+        -- both, so the single-column versions are redundant prefixes
+        DROP INDEX IF EXISTS idx_leads_status;
+        DROP INDEX IF EXISTS idx_leads_source;
+        DROP INDEX IF EXISTS idx_leads_intent;
+        CREATE INDEX IF NOT EXISTS idx_leads_status_score ON leads(status, score DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_source_score ON leads(source, score DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_intent_score ON leads(intent_category, score DESC, id DESC);
+
+        -- (sort column, id) pairs back keyset pagination in get_leads
+        DROP INDEX IF EXISTS idx_leads_score;
+        CREATE INDEX IF NOT EXISTS idx_leads_score_id ON leads(score DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_ai_score_id ON leads(ai_score DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_discovered_id ON leads(discovered_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_created_id ON leads(created_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_upvotes_id ON leads(engagement_upvotes DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_leads_title_id ON leads(title, id);
     """)
+
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(leads)")}
+    if "norm_title" not in columns:
+        # Backfill one row per title so the unique index below can be built over old data
+        conn.executescript(f"""
+            ALTER TABLE leads ADD COLUMN norm_title TEXT;
+            UPDATE leads SET norm_title = {_NORM_TITLE_SQL.format("title")}
+            WHERE id IN (SELECT MIN(id) FROM leads GROUP BY {_NORM_TITLE_SQL.format("title")});
+        """)
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_leads_norm ON leads(norm_title) WHERE norm_title != ''")
+    # Refresh planner statistics so it can choose between the composite indexes
+    conn.execute("ANALYZE")
     conn.commit()
-    conn.close()
+
+    global _fts_enabled
+    _fts_enabled = _init_fts(conn)
+
+
+def _init_fts(conn: sqlite3.Connection) -> bool:
+    """Create the trigram FTS5 index over title/text. False if FTS5 is unavailable."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'leads_fts'"
+    ).fetchone()
+    try:
+        conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS leads_fts USING fts5(
+                title, text, content='leads', content_rowid='id', tokenize='trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS leads_fts_ai AFTER INSERT ON leads BEGIN
+                INSERT INTO leads_fts(rowid, title, text) VALUES (new.id, new.title, new.text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS leads_fts_ad AFTER DELETE ON leads BEGIN
+                INSERT INTO leads_fts(leads_fts, rowid, title, text)
+                VALUES ('delete', old.id, old.title, old.text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS leads_fts_au AFTER UPDATE OF title, text ON leads BEGIN
+                INSERT INTO leads_fts(leads_fts, rowid, title, text)
+                VALUES ('delete', old.id, old.title, old.text);
+                INSERT INTO leads_fts(rowid, title, text) VALUES (new.id, new.title, new.text);
+            END;
+        """)
+        if not exists:
+            conn.execute("INSERT INTO leads_fts(leads_fts) VALUES ('rebuild')")
+        conn.commit()
+        return True
+    except sqlite3.OperationalError as e:
+        print(f"  [DB] Full-text search disabled: {e}")
+        return False
 
 
 # --- Lead CRUD ---
 
+# Same post re-seen (same URL) refreshes the row; the same title under a different
+# URL (reposts, cross-posts) collapses onto the existing lead, keeping the best score.
+_UPSERT_LEAD_SQL = f"""
+    INSERT INTO leads (source, title, url, author, text, score, ai_score, ai_reasoning,
+                     intent_category, suggested_response, engagement_upvotes, engagement_comments,
+                     status, discovered_at, norm_title)
+    VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, 'new', CURRENT_TIMESTAMP,
+            {_NORM_TITLE_SQL.format("?2")})
+    ON CONFLICT(url) DO UPDATE SET
+        score = excluded.score,
+        ai_score = excluded.ai_score,
+        ai_reasoning = excluded.ai_reasoning,
+        intent_category = excluded.intent_category,
+        suggested_response = excluded.suggested_response,
+        engagement_upvotes = excluded.engagement_upvotes,
+        engagement_comments = excluded.engagement_comments
+    ON CONFLICT(norm_title) WHERE norm_title != '' DO UPDATE SET
+        score = COALESCE(MAX(score, excluded.score), score, excluded.score)
+"""
+
+
+def _lead_params(lead: dict) -> tuple:
+    return (
+        lead.get("source", ""),
+        lead.get("title", ""),
+        lead.get("url", ""),
+        lead.get("author", ""),
+        lead.get("text", ""),
+        lead.get("score"),
+        lead.get("ai_score"),
+        lead.get("ai_reasoning"),
+        lead.get("intent_category"),
+        lead.get("suggested_response"),
+        lead.get("engagement_upvotes", 0),
+        lead.get("engagement_comments", 0),
+    )
+
+
 def upsert_lead(lead: dict) -> int:
     conn = get_connection()
+    with conn:
+        conn.execute(_UPSERT_LEAD_SQL, _lead_params(lead))
+    _bump_leads_version()
+    return conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+
+def upsert_leads(leads: list[dict]) -> int:
+    """Upsert many leads in a single transaction. Returns the number written."""
+    if not leads:
+        return 0
+    conn = get_connection()
+    with conn:
+        conn.executemany(_UPSERT_LEAD_SQL, [_lead_params(lead) for lead in leads])
+    _bump_leads_version()
+    return len(leads)
+
+
+LEAD_SORT_COLUMNS = {"score", "ai_score", "discovered_at", "created_at", "engagement_upvotes", "title"}
+
+LEAD_COLUMNS = (
+    "id", "source", "title", "url", "author", "text", "score", "ai_score", "ai_reasoning",
+    "intent_category", "suggested_response", "engagement_upvotes", "engagement_comments",
+    "status", "notes", "discovered_at", "contacted_at", "created_at", "norm_title",
+)
+
+# What the dashboard list renders; leaves out the bulky text/AI columns. notes stays
+# in so the editable notes box never starts blank and saves over them
+LEAD_LIST_COLUMNS = (
+    "id", "title", "url", "source", "author", "score", "ai_score", "intent_category",
+    "status", "notes", "discovered_at", "engagement_upvotes", "engagement_comments",
+)
+
+
+def lead_cursor(lead: dict, sort_by: str = "score") -> str:
+    """Opaque keyset cursor pointing just past `lead` in a get_leads listing."""
+    if sort_by not in LEAD_SORT_COLUMNS:
+        sort_by = "score"
+    raw = json.dumps([lead.get(sort_by), lead["id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
     try:
-        conn.execute("""
-            INSERT INTO leads (source, title, url, author, text, score, ai_score, ai_reasoning,
-                             intent_category, suggested_response, engagement_upvotes, engagement_comments,
-                             status, discovered_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'new', CURRENT_TIMESTAMP)
-            ON CONFLICT(url) DO UPDATE SET
-                score = excluded.score,
-                ai_score = excluded.ai_score,
-                ai_reasoning = excluded.ai_reasoning,
-                intent_category = excluded.intent_category,
-                suggested_response = excluded.suggested_response,
-                engagement_upvotes = excluded.engagement_upvotes,
-                engagement_comments = excluded.engagement_comments
-        """, (
-            lead.get("source", ""),
-            lead.get("title", ""),
-            lead.get("url", ""),
-            lead.get("author", ""),
-            lead.get("text", ""),
-            lead.get("score"),
-            lead.get("ai_score"),
-            lead.get("ai_reasoning"),
-            lead.get("intent_category"),
-            lead.get("suggested_response"),
-            lead.get("engagement_upvotes", 0),
-            lead.get("engagement_comments", 0),
-        ))
-        conn.commit()
-        return conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-    finally:
-        conn.close()
+        value, lead_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(lead_id, int) or not (value is None or isinstance(value, (str, int, float))):
+        raise ValueError("Invalid cursor")
+    return value, lead_id
 
 
 def get_leads(status=None, source=None, min_score=None, intent_category=None,
-              sort_by="score", sort_order="desc", limit=100, offset=0) -> list[dict]:
+              sort_by="score", sort_order="desc", limit=100, offset=0,
+              cursor: str | None = None, q: str | None = None,
+              fields: list[str] | None = None) -> list[dict]:
+    """List leads. Pass `cursor` (from lead_cursor) instead of `offset` to page
+    without SQLite walking and discarding every skipped row. `q` is a substring
+    search over title and text. `fields` limits the columns returned (default all)."""
+    if sort_by not in LEAD_SORT_COLUMNS:
+        sort_by = "score"
+
+    if fields:
+        # id and the sort column are always needed to build the next cursor
+        cols = [c for c in LEAD_COLUMNS if c in fields or c in ("id", sort_by)]
+        select = ", ".join(cols)
+    else:
+        select = "*"
+
     conn = get_connection()
-    query = "SELECT * FROM leads WHERE 1=1"
+    query = f"SELECT {select} FROM leads WHERE 1=1"
     params = []
 
     if status:
@@ -123,24 +283,42 @@ def get_leads(status=None, source=None, min_score=None, intent_category=None,
     if intent_category:
         query += " AND intent_category = ?"
         params.append(intent_category)
+    if q:
+        # Trigram FTS needs at least three characters to match anything
+        if _fts_enabled and len(q) >= 3:
+            query += " AND id IN (SELECT rowid FROM leads_fts WHERE leads_fts MATCH ?)"
+            params.append('"' + q.replace('"', '""') + '"')
+        else:
+            query += " AND (title LIKE ? OR text LIKE ?)"
+            params.extend([f"%{q}%", f"%{q}%"])
 
-    allowed_sorts = {"score", "ai_score", "discovered_at", "created_at", "engagement_upvotes", "title"}
-    if sort_by not in allowed_sorts:
-        sort_by = "score"
     order = "DESC" if sort_order.lower() == "desc" else "ASC"
-    query += f" ORDER BY {sort_by} {order} NULLS LAST"
-    query += " LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
+    order_by = f" ORDER BY {sort_by} {order} NULLS LAST, id {order} LIMIT ? OFFSET ?"
+
+    def fetch(where: str, extra: list, n: int) -> list:
+        return conn.execute(query + where + order_by, params + extra + [n, 0]).fetchall()
+
+    if not cursor:
+        rows = conn.execute(query + order_by, params + [limit, offset]).fetchall()
+    else:
+        value, last_id = _decode_cursor(cursor)
+        cmp = "<" if order == "DESC" else ">"
+        # NULL sort values come after all others (NULLS LAST), so a listing is two
+        # phases, each an index seek on (sort column, id): the non-NULL range via a
+        # row-value comparison (which never matches NULL), then the NULL tail
+        if value is None:
+            rows = fetch(f" AND {sort_by} IS NULL AND id {cmp} ?", [last_id], limit)
+        else:
+            rows = fetch(f" AND ({sort_by}, id) {cmp} (?, ?)", [value, last_id], limit)
+            if len(rows) < limit:
+                rows += fetch(f" AND {sort_by} IS NULL", [], limit - len(rows))
 
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
 def get_lead(lead_id: int) -> dict | None:
     conn = get_connection()
     row = conn.execute("SELECT * FROM leads WHERE id = ?", (lead_id,)).fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
@@ -149,7 +327,6 @@ def update_lead(lead_id: int, updates: dict) -> bool:
     allowed = {"status", "notes", "contacted_at"}
     fields = {k: v for k, v in updates.items() if k in allowed}
     if not fields:
-        conn.close()
         return False
 
     if fields.get("status") == "contacted" and "contacted_at" not in fields:
@@ -157,9 +334,9 @@ def update_lead(lead_id: int, updates: dict) -> bool:
 
     set_clause = ", ".join(f"{k} = ?" for k in fields)
     values = list(fields.values()) + [lead_id]
-    conn.execute(f"UPDATE leads SET {set_clause} WHERE id = ?", values)
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(f"UPDATE leads SET {set_clause} WHERE id = ?", values)
+    _bump_leads_version()
     return True
 
 
@@ -167,53 +344,78 @@ def update_lead(lead_id: int, updates: dict) -> bool:
 
 def create_scan(sources_used: list[str]) -> int:
     conn = get_connection()
-    conn.execute("INSERT INTO scans (sources_used, status) VALUES (?, 'running')",
-                 (json.dumps(sources_used),))
-    conn.commit()
-    scan_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-    conn.close()
-    return scan_id
+    with conn:
+        cur = conn.execute("INSERT INTO scans (sources_used, status) VALUES (?, 'running')",
+                           (json.dumps(sources_used),))
+    return cur.lastrowid
 
 
 def complete_scan(scan_id: int, total_signals: int, leads_found: int, status: str = "completed"):
     conn = get_connection()
-    conn.execute("""
-        UPDATE scans SET completed_at = CURRENT_TIMESTAMP, total_signals = ?,
-               leads_found = ?, status = ? WHERE id = ?
-    """, (total_signals, leads_found, status, scan_id))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("""
+            UPDATE scans SET completed_at = CURRENT_TIMESTAMP, total_signals = ?,
+                   leads_found = ?, status = ? WHERE id = ?
+        """, (total_signals, leads_found, status, scan_id))
 
 
 def get_scans(limit: int = 20) -> list[dict]:
     conn = get_connection()
     rows = conn.execute("SELECT * FROM scans ORDER BY started_at DESC LIMIT ?", (limit,)).fetchall()
-    conn.close()
     return [dict(r) for r in rows]
 
 
 # --- Stats ---
 
+def _bump_leads_version():
+    global _leads_version
+    _leads_version += 1
+
+
 def get_stats() -> dict:
+    global _stats_cache
+    key = (_leads_version, datetime.now(timezone.utc).date())
+    cached = _stats_cache
+    if cached and cached[0] == key and time.monotonic() - cached[1] < STATS_CACHE_TTL:
+        return copy.deepcopy(cached[2])
+
+    stats = _compute_stats()
+    _stats_cache = (key, time.monotonic(), stats)
+    return copy.deepcopy(stats)
+
+
+def _compute_stats() -> dict:
     conn = get_connection()
-    total = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
-    today = conn.execute("SELECT COUNT(*) FROM leads WHERE date(discovered_at) = date('now')").fetchone()[0]
-    by_status = {}
-    for row in conn.execute("SELECT status, COUNT(*) as cnt FROM leads GROUP BY status").fetchall():
-        by_status[row["status"]] = row["cnt"]
-    by_source = {}
-    for row in conn.execute("SELECT source, COUNT(*) as cnt FROM leads GROUP BY source").fetchall():
-        by_source[row["source"]] = row["cnt"]
-    avg_score = conn.execute("SELECT AVG(score) FROM leads").fetchone()[0] or 0
-    by_intent = {}
-    for row in conn.execute("SELECT intent_category, COUNT(*) as cnt FROM leads WHERE intent_category IS NOT NULL GROUP BY intent_category").fetchall():
-        by_intent[row["intent_category"]] = row["cnt"]
+    # One pass over leads: count per (status, source, intent) cell and roll up in Python
+    rows = conn.execute("""
+        SELECT status, source, intent_category,
+               COUNT(*) AS cnt,
+               SUM(date(discovered_at) = date('now')) AS today,
+               SUM(score) AS score_sum,
+               COUNT(score) AS score_cnt
+        FROM leads
+        GROUP BY status, source, intent_category
+    """).fetchall()
+
+    total = today = score_cnt = 0
+    score_sum = 0.0
+    by_status, by_source, by_intent = {}, {}, {}
+    for row in rows:
+        cnt = row["cnt"]
+        total += cnt
+        today += row["today"] or 0
+        score_sum += row["score_sum"] or 0
+        score_cnt += row["score_cnt"]
+        by_status[row["status"]] = by_status.get(row["status"], 0) + cnt
+        by_source[row["source"]] = by_source.get(row["source"], 0) + cnt
+        if row["intent_category"] is not None:
+            by_intent[row["intent_category"]] = by_intent.get(row["intent_category"], 0) + cnt
+    avg_score = score_sum / score_cnt if score_cnt else 0
 
     converted = by_status.get("converted", 0)
     contacted = by_status.get("contacted", 0) + by_status.get("replied", 0) + converted
     conversion_rate = (converted / contacted * 100) if contacted > 0 else 0
 
-    conn.close()
     return {
         "total_leads": total,
         "new_today": today,
@@ -230,15 +432,13 @@ def get_stats() -> dict:
 def get_config_value(key: str) -> str | None:
     conn = get_connection()
     row = conn.execute("SELECT value FROM config WHERE key = ?", (key,)).fetchone()
-    conn.close()
     return row["value"] if row else None
 
 
 def set_config_value(key: str, value: str):
     conn = get_connection()
-    conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, value))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, value))
 
 
 # Initialize on import
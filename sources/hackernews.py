@@ -3,13 +3,25 @@ Hacker News signal source.
 Uses the free Algolia HN Search API — no API key required.
 """
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 
 HN_SEARCH_URL = "https://hn.algolia.com/api/v1/search"
 HN_ITEM_URL = "https://news.ycombinator.com/item?id="
+MAX_CONCURRENT_QUERIES = 5
+
+# One keep-alive pool for all queries, so only the first pays for the TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
 
 
 def fetch_signals(config: dict) -> list[dict]:
@@ -21,46 +33,59 @@ def fetch_signals(config: dict) -> list[dict]:
     keywords = config["icp"]["keywords"]
     search_queries = hn_config.get("search_queries", keywords[:4])
     max_stories = hn_config.get("max_stories", 100)
+    if not search_queries:
+        return []
+
+    hits_per_page = min(max_stories // len(search_queries), 50)
+    since = int(time.time()) - 7*86400  # last 7 days
+
+    # Algolia allows ~10k requests/hour per IP, so a handful of queries can run side by side
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_QUERIES) as pool:
+        results = list(pool.map(lambda q: _search(q, hits_per_page, since), search_queries))
 
     signals = []
     seen_ids = set()
+    append = signals.append
 
-    for query in search_queries:
-        try:
-            resp = requests.get(HN_SEARCH_URL, params={
-                "query": query,
-                "tags": "(story,show_hn,ask_hn)",
-                "hitsPerPage": min(max_stories // len(search_queries), 50),
-                "numericFilters": f"created_at_i>{int(time.time()) - 7*86400}",  # last 7 days
-            }, timeout=15)
-            resp.raise_for_status()
-            hits = resp.json().get("hits", [])
-        except Exception as e:
-            print(f"  [HN] Error searching '{query}': {e}")
-            continue
-
+    for hits in results:
         for hit in hits:
-            obj_id = hit.get("objectID", "")
+            obj_id = hit["objectID"]  # always present in Algolia hits
             if obj_id in seen_ids:
                 continue
             seen_ids.add(obj_id)
 
-            title = hit.get("title") or ""
-            text = hit.get("story_text") or hit.get("comment_text") or ""
-            content = f"{title} {text}".strip()
+            get = hit.get
+            title = get("title") or ""
+            text = get("story_text") or get("comment_text") or ""
+            item_url = f"{HN_ITEM_URL}{obj_id}"
 
-            signals.append({
+            append({
                 "source": "hackernews",
                 "id": f"hn-{obj_id}",
                 "title": title,
-                "content": content,
-                "url": hit.get("url") or f"{HN_ITEM_URL}{obj_id}",
-                "hn_url": f"{HN_ITEM_URL}{obj_id}",
-                "author": hit.get("author", ""),
-                "created_at": hit.get("created_at", ""),
-                "points": hit.get("points", 0) or 0,
-                "num_comments": hit.get("num_comments", 0) or 0,
+                "content": f"{title} {text}".strip(),
+                "url": get("url") or item_url,
+                "hn_url": item_url,
+                "author": get("author", ""),
+                "created_at": get("created_at", ""),
+                "points": get("points") or 0,
+                "num_comments": get("num_comments") or 0,
             })
 
     print(f"  [HN] Fetched {len(signals)} signals")
     return signals
+
+
+def _search(query: str, hits_per_page: int, since: int) -> list[dict]:
+    try:
+        resp = _SESSION.get(HN_SEARCH_URL, params={
+            "query": query,
+            "tags": "(story,show_hn,ask_hn)",
+            "hitsPerPage": hits_per_page,
+            "numericFilters": f"created_at_i>{since}",
+        }, timeout=15)
+        resp.raise_for_status()
+        return orjson.loads(resp.content).get("hits", [])
+    except Exception as e:
+        print(f"  [HN] Error searching '{query}': {e}")
+        return []
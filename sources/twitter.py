@@ -5,9 +5,15 @@ Falls back gracefully if unavailable.
 """
 
 import requests
-import time
+from requests.adapters import HTTPAdapter
 import re
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
 
 
 NITTER_INSTANCES = [
@@ -16,6 +22,20 @@ NITTER_INSTANCES = [
 ]
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; SignalScout/2.0)"}
+MAX_CONCURRENT_QUERIES = 4
+
+# Keep-alive pool shared by the query workers; falling through to the next instance
+# stands in for retries
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+_RE_BLOCK = re.compile(r'<div class="timeline-item[^"]*">(.*?)</div>\s*</div>\s*</div>', re.DOTALL)
+_RE_USER = re.compile(r'class="username"[^>]*>@?([^<]+)</a>')
+_RE_TEXT = re.compile(r'class="tweet-content[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_RE_LINK = re.compile(r'class="tweet-link"[^>]*href="([^"]+)"')
+_RE_TAGS = re.compile(r'<[^>]+>')
+_RE_STATUS = re.compile(r'/status/(\d+)')
 
 
 def fetch_signals(config: dict) -> list[dict]:
@@ -25,77 +45,124 @@ def fetch_signals(config: dict) -> list[dict]:
         return []
 
     keywords = config["icp"]["keywords"][:4]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_QUERIES) as pool:
+        results = list(pool.map(_search, keywords))
+
     signals = []
     seen_ids = set()
 
-    for query in keywords:
-        for instance in NITTER_INSTANCES:
-            try:
-                url = f"{instance}/search"
-                resp = requests.get(url, params={"f": "tweets", "q": query},
-                                    headers=HEADERS, timeout=10)
-                if resp.status_code != 200:
-                    continue
-
-                # Parse basic tweet data from HTML
-                tweets = _parse_nitter_html(resp.text, instance)
-                for tweet in tweets:
-                    tid = tweet.get("id", "")
-                    if tid in seen_ids:
-                        continue
-                    seen_ids.add(tid)
-                    signals.append(tweet)
-                break  # Success with this instance
-            except Exception as e:
-                print(f"  [Twitter] Error with {instance}: {e}")
+    for tweets in results:
+        for tweet in tweets:
+            tid = tweet.get("id", "")
+            if tid in seen_ids:
                 continue
-        time.sleep(1)
+            seen_ids.add(tid)
+            signals.append(tweet)
 
     print(f"  [Twitter] Fetched {len(signals)} signals")
     return signals
 
 
+def _search(query: str) -> list[dict]:
+    for instance in NITTER_INSTANCES:
+        try:
+            url = f"{instance}/search"
+            resp = _SESSION.get(url, params={"f": "tweets", "q": query}, timeout=10)
+            if resp.status_code != 200:
+                continue
+
+            # Parse basic tweet data from HTML
+            return _parse_nitter_html(resp.text, instance)  # Success with this instance
+        except Exception as e:
+            print(f"  [Twitter] Error with {instance}: {e}")
+            continue
+    return []
+
+
 def _parse_nitter_html(html: str, instance: str) -> list[dict]:
+    """Parse Nitter search results; one lxml tree walk when lxml is installed."""
+    if lxml_html is None:
+        return _parse_nitter_html_regex(html, instance)
+
+    tweets = []
+    skipped = 0
+    try:
+        tree = lxml_html.fromstring(html)
+    except Exception:
+        return tweets
+
+    for item in tree.find_class("timeline-item")[:20]:
+        try:
+            username = _class_text(item, "username").lstrip("@")
+            text = _class_text(item, "tweet-content")
+            links = item.find_class("tweet-link")
+            path = links[0].get("href", "") if links else ""
+
+            tweet = _make_tweet(username, text, path)
+            if tweet:
+                tweets.append(tweet)
+        except Exception:
+            skipped += 1
+
+    if skipped:
+        print(f"  [Twitter] Skipped {skipped} unparseable results from {instance}")
+    return tweets
+
+
+def _class_text(element, class_name: str) -> str:
+    found = element.find_class(class_name)
+    return found[0].text_content().strip() if found else ""
+
+
+def _parse_nitter_html_regex(html: str, instance: str) -> list[dict]:
     """Basic HTML parsing for Nitter search results."""
     tweets = []
+    skipped = 0
     # Find tweet containers
-    tweet_blocks = re.findall(
-        r'<div class="timeline-item[^"]*">(.*?)</div>\s*</div>\s*</div>',
-        html, re.DOTALL
-    )
+    tweet_blocks = _RE_BLOCK.findall(html)
 
     for block in tweet_blocks[:20]:
         try:
             # Extract username
-            username_match = re.search(r'class="username"[^>]*>@?([^<]+)</a>', block)
+            username_match = _RE_USER.search(block)
             username = username_match.group(1).strip() if username_match else ""
 
             # Extract tweet text
-            text_match = re.search(r'class="tweet-content[^"]*"[^>]*>(.*?)</div>', block, re.DOTALL)
-            text = re.sub(r'<[^>]+>', '', text_match.group(1)).strip() if text_match else ""
+            text_match = _RE_TEXT.search(block)
+            text = _RE_TAGS.sub('', text_match.group(1)).strip() if text_match else ""
 
             # Extract link
-            link_match = re.search(r'class="tweet-link"[^>]*href="([^"]+)"', block)
+            link_match = _RE_LINK.search(block)
             path = link_match.group(1) if link_match else ""
 
-            if not text:
-                continue
-
-            tweet_id = re.search(r'/status/(\d+)', path)
-            tid = f"twitter-{tweet_id.group(1)}" if tweet_id else f"twitter-{hash(text)}"
-
-            tweets.append({
-                "source": "twitter",
-                "id": tid,
-                "title": text[:120],
-                "content": text,
-                "url": f"https://twitter.com{path}" if path else "",
-                "author": username,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "points": 0,
-                "num_comments": 0,
-            })
+            tweet = _make_tweet(username, text, path)
+            if tweet:
+                tweets.append(tweet)
         except Exception:
-            continue
+            skipped += 1
 
+    if skipped:
+        print(f"  [Twitter] Skipped {skipped} unparseable results from {instance}")
     return tweets
+
+
+def _make_tweet(username: str, text: str, path: str) -> dict | None:
+    if not text:
+        return None
+
+    tweet_id = _RE_STATUS.search(path)
+    tid = f"twitter-{tweet_id.group(1)}" if tweet_id else f"twitter-{hash(text)}"
+
+    return {
+        "source": "twitter",
+        "id": tid,
+        "title": text[:120],
+        "content": text,
+        "url": f"https://twitter.com{path}" if path else "",
+        "author": username,
+        # The post time isn't parsed, so stamp the fetch time as a Unix timestamp;
+        # the scorer reads numbers without an ISO round trip
+        "created_at": time.time(),
+        "points": 0,
+        "num_comments": 0,
+    }